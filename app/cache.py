@@ -0,0 +1,69 @@
+"""In-memory copies of the static `translations` and `books` tables.
+
+Both tables are tiny and never change while the API is running, so they are
+loaded once at startup and served from these module-level lookups instead of
+querying SQLite on every request.
+"""
+import sqlite3
+from typing import Any, Dict, List, Tuple
+
+
+# Entries are plain dicts shaped like the `Translation` and `Book` models so
+# they can be returned from endpoints as-is.
+Row = Dict[str, Any]
+
+TRANSLATIONS: List[Row] = []  # ordered by name
+TRANSLATIONS_BY_ID: Dict[int, Row] = {}
+TRANSLATIONS_BY_ABBR: Dict[str, Row] = {}
+TRANSLATIONS_BY_LANGUAGE: Dict[str, List[Row]] = {}
+
+BOOKS: List[Row] = []  # ordered by id
+BOOKS_BY_ID: Dict[int, Row] = {}
+BOOKS_BY_NAME: Dict[str, Row] = {}
+BOOKS_BY_TESTAMENT: Dict[str, List[Row]] = {}
+BOOK_IDS_BY_TESTAMENT: Dict[str, Tuple[int, ...]] = {}
+
+SQL_GET_ALL_TRANSLATIONS = "SELECT id, name, abbreviation, language FROM translations ORDER BY name"
+SQL_GET_ALL_BOOKS = "SELECT id, name, testament FROM books ORDER BY id"
+
+
+def load(conn: sqlite3.Connection) -> None:
+    """
+    Populate the lookups from the database.
+    
+    The containers are updated in place so modules that imported them keep
+    seeing the current data.
+    
+    Args:
+        conn: Open database connection with row factory set to Row.
+    """
+    translations = [
+        dict(row)
+        for row in conn.execute(SQL_GET_ALL_TRANSLATIONS)
+    ]
+    books = [
+        dict(row)
+        for row in conn.execute(SQL_GET_ALL_BOOKS)
+    ]
+
+    TRANSLATIONS[:] = translations
+    TRANSLATIONS_BY_ID.clear()
+    TRANSLATIONS_BY_ABBR.clear()
+    TRANSLATIONS_BY_LANGUAGE.clear()
+    for translation in translations:
+        TRANSLATIONS_BY_ID[translation["id"]] = translation
+        TRANSLATIONS_BY_ABBR[translation["abbreviation"]] = translation
+        TRANSLATIONS_BY_LANGUAGE.setdefault(translation["language"], []).append(translation)
+
+    BOOKS[:] = books
+    BOOKS_BY_ID.clear()
+    BOOKS_BY_NAME.clear()
+    BOOKS_BY_TESTAMENT.clear()
+    for book in books:
+        BOOKS_BY_ID[book["id"]] = book
+        BOOKS_BY_NAME[book["name"]] = book
+        BOOKS_BY_TESTAMENT.setdefault(book["testament"], []).append(book)
+
+    BOOK_IDS_BY_TESTAMENT.clear()
+    for testament, testament_books in BOOKS_BY_TESTAMENT.items():
+        BOOK_IDS_BY_TESTAMENT[testament] = tuple(book["id"] for book in testament_books)
@@ -4,29 +4,117 @@ Database file path is configurable via the `BIBLES_DB_PATH` environment
 variable to make the deployment container-friendly. If the environment
 variable is not set, it falls back to `bibles.db` in the project root.
 """
+import functools
+import logging
 import os
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Callable, Generator, List, Sequence, TypeVar
 from pathlib import Path
+from urllib.parse import quote
+
+import anyio
 from fastapi import HTTPException
 
 
 DEFAULT_DB = Path(__file__).parent.parent / "bibles.db"
 DATABASE_PATH = Path(os.getenv("BIBLES_DB_PATH", str(DEFAULT_DB))).resolve()
 
+# Upper bound on pooled connections, overridable via `BIBLES_DB_POOL_SIZE`.
+POOL_SIZE = int(os.getenv("BIBLES_DB_POOL_SIZE", str(2 * (os.cpu_count() or 1))))
+
+# Request-serving connections open the file read-only and `immutable`, which
+# tells SQLite it cannot change underneath them: no file locks are taken and no
+# journal or WAL is consulted. Any schema maintenance must therefore finish
+# (and leave the file in rollback-journal mode) before these are opened.
+_READ_ONLY_URI = f"file:{quote(DATABASE_PATH.as_posix())}?mode=ro&immutable=1"
+
+# Maintenance connections may write but, unlike a plain path, never create an
+# empty database file when `DATABASE_PATH` is missing.
+_READ_WRITE_URI = f"file:{quote(DATABASE_PATH.as_posix())}?mode=rw"
+
+# Per-connection tuning for the read path. `cache_size` is negative so it is
+# interpreted in KiB (~20 MB page cache); the 1 GB mmap window lets verse text
+# be read straight from the OS page cache.
+_READ_PRAGMAS = (
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824",
+)
+
+# The maintenance connection waits for other workers that are still building
+# indexes at startup instead of failing after a few seconds.
+_MAINTENANCE_BUSY_TIMEOUT_MS = 600_000
+
+
+def _connect() -> sqlite3.Connection:
+    """Open a read-only connection that may be shared across threads.
+
+    Pooled connections keep the default tuple rows; request handlers unpack
+    them positionally rather than paying for `sqlite3.Row` lookups.
+    """
+    conn = sqlite3.connect(_READ_ONLY_URI, uri=True, check_same_thread=False)
+    for pragma in _READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Connections are opened lazily up to POOL_SIZE and then reused. They are
+# read-only, so handing them to FastAPI's worker threads is safe; pooling
+# rather than sharing one connection lets those threads query in parallel.
+# LIFO order keeps the most recently used (warmest) connection in rotation.
+_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=POOL_SIZE)
+_pool_lock = threading.Lock()
+_pool_opened = 0
+
+
+def _acquire() -> sqlite3.Connection:
+    """Take a connection from the pool, opening a new one if below capacity."""
+    global _pool_opened
+
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        pass
+
+    with _pool_lock:
+        if _pool_opened < POOL_SIZE:
+            conn = _connect()
+            _pool_opened += 1
+            return conn
+
+    # Pool is at capacity: wait for another request to release a connection.
+    return _pool.get()
+
+
+def close_pool() -> None:
+    """Close every idle pooled connection, e.g. at shutdown."""
+    global _pool_opened
+
+    while True:
+        try:
+            conn = _pool.get_nowait()
+        except queue.Empty:
+            return
+        conn.close()
+        with _pool_lock:
+            _pool_opened -= 1
+
 
 @contextmanager
 def get_db() -> Generator[sqlite3.Connection, None, None]:
     """
-    Context manager for database connections.
+    Context manager for pooled database connections.
+    
+    The connection is returned to the pool on exit rather than closed.
     
     Yields:
-        sqlite3.Connection: Database connection with row factory set to Row.
+        sqlite3.Connection: Database connection returning plain tuple rows.
     """
     try:
-        conn = sqlite3.connect(str(DATABASE_PATH))
-        conn.row_factory = sqlite3.Row
+        conn = _acquire()
     except sqlite3.OperationalError as e:
         # Raise an HTTP-friendly error so FastAPI can return JSON
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
@@ -34,19 +122,266 @@ def get_db() -> Generator[sqlite3.Connection, None, None]:
     try:
         yield conn
     finally:
-        conn.close()
+        _pool.put(conn)
+
+
+def run_query(sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+    """
+    Execute a query on a pooled connection and return all rows.
+    
+    Args:
+        sql: SQL statement to execute.
+        params: Positional parameters for the statement.
+        
+    Returns:
+        List[tuple]: The result rows.
+    """
+    with get_db() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+# Threads that may wait on the pool come from a limiter sized to the pool
+# rather than anyio's default one. Streamed responses hold a pooled connection
+# between chunks and need default-pool threads to produce the next one, so
+# nothing running on those threads may block waiting for a connection.
+_query_limiter = anyio.CapacityLimiter(POOL_SIZE)
+
+
+async def acquire_connection() -> sqlite3.Connection:
+    """
+    Check out a pooled connection for a streamed response.
+    
+    Checking out, which may open the connection or wait for a free one,
+    happens on a `fetch_all` worker thread, never the event loop or one of
+    anyio's default threads. The caller owns the connection until it hands it
+    back with `release_connection`.
+    
+    Returns:
+        sqlite3.Connection: Database connection returning plain tuple rows.
+    """
+    try:
+        conn = await anyio.to_thread.run_sync(_acquire, limiter=_query_limiter)
+    except sqlite3.OperationalError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {e}")
+    return conn
+
+
+def release_connection(conn: sqlite3.Connection) -> None:
+    """Return a connection from `acquire_connection` to the pool."""
+    _pool.put(conn)
+
+
+async def fetch_all(sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+    """
+    Run `run_query` in a worker thread so the event loop stays free.
+    
+    Args:
+        sql: SQL statement to execute.
+        params: Positional parameters for the statement.
+        
+    Returns:
+        List[tuple]: The result rows.
+    """
+    return await anyio.to_thread.run_sync(
+        functools.partial(run_query, sql, params), limiter=_query_limiter
+    )
 
 
 def get_db_connection() -> sqlite3.Connection:
     """
-    Get a database connection.
+    Get a standalone, writable database connection for startup maintenance.
+    
+    Request handlers should use `get_db()` instead.
     
     Returns:
         sqlite3.Connection: Database connection with row factory set to Row.
     """
     try:
-        conn = sqlite3.connect(str(DATABASE_PATH))
+        conn = sqlite3.connect(_READ_WRITE_URI, uri=True)
+        conn.execute(f"PRAGMA busy_timeout={_MAINTENANCE_BUSY_TIMEOUT_MS}")
         conn.row_factory = sqlite3.Row
         return conn
     except sqlite3.OperationalError as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
+
+
+# Secondary indexes the API's lookups rely on, as (name, table, columns, unique).
+# They are only created when no existing index already leads with the same
+# columns, so databases built from the canonical schema are left untouched.
+_LOOKUP_INDEXES = (
+    ("idx_verses_lookup", "verses", ("translation_id", "book_id", "chapter", "verse"), False),
+    ("idx_translations_abbr", "translations", ("abbreviation",), True),
+    ("idx_books_name", "books", ("name",), False),
+)
+
+_verse_fts_enabled = False
+
+T = TypeVar("T")
+
+
+def _has_index(conn: sqlite3.Connection, table: str, columns: Sequence[str]) -> bool:
+    """Return True if `table` has an index whose leading columns are `columns`."""
+    for index in conn.execute(f'PRAGMA index_list("{table}")').fetchall():
+        indexed = [row["name"] for row in conn.execute(f'PRAGMA index_info("{index["name"]}")')]
+        if indexed[:len(columns)] == list(columns):
+            return True
+    return False
+
+
+def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    cursor = conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,))
+    return cursor.fetchone() is not None
+
+
+def _create_lookup_indexes(conn: sqlite3.Connection) -> bool:
+    """Create any missing `_LOOKUP_INDEXES`; return True if one was added."""
+    created = False
+    for name, table, columns, unique in _LOOKUP_INDEXES:
+        if _has_index(conn, table, columns):
+            continue
+        try:
+            conn.execute(
+                f"CREATE {'UNIQUE ' if unique else ''}INDEX {name} "
+                f"ON {table}({', '.join(columns)})"
+            )
+        except sqlite3.IntegrityError as e:
+            # Duplicate values rule out a unique index; lookups still work
+            # without it, so keep going with the remaining indexes.
+            logging.warning("Could not create index %s: %s", name, e)
+        else:
+            created = True
+    return created
+
+
+def _create_trigram_table(conn: sqlite3.Connection) -> bool:
+    """Build the `verses_tri` trigram index if missing; return True if built."""
+    if _table_exists(conn, "verses_tri"):
+        return False
+    conn.execute(
+        "CREATE VIRTUAL TABLE verses_tri USING fts5("
+        "text, content='verses', content_rowid='id', "
+        "tokenize='trigram')"
+    )
+    conn.execute("INSERT INTO verses_tri(verses_tri) VALUES('rebuild')")
+    return True
+
+
+def _statistics_missing(conn: sqlite3.Connection) -> bool:
+    """Return True if a non-empty table or one of its indexes lacks `sqlite_stat1` rows."""
+    if not _table_exists(conn, "sqlite_stat1"):
+        return True
+    analyzed = {(row["tbl"], row["idx"]) for row in conn.execute("SELECT tbl, idx FROM sqlite_stat1")}
+    analyzed_tables = {tbl for tbl, _ in analyzed}
+    # Virtual tables have no b-tree of their own (rootpage 0); their shadow
+    # tables, such as verses_tri_data, are listed and checked separately.
+    # WITHOUT ROWID tables record their primary key under the table's own name,
+    # so only indexes listed in sqlite_master are checked individually.
+    objects = conn.execute(
+        "SELECT type, name, tbl_name FROM sqlite_master "
+        "WHERE type IN ('table', 'index') AND rootpage != 0 AND tbl_name NOT LIKE 'sqlite_%'"
+    ).fetchall()
+    for obj in objects:
+        table = obj["tbl_name"]
+        # ANALYZE records nothing for empty tables, so they never count as missing.
+        if conn.execute(f'SELECT 1 FROM "{table}" LIMIT 1').fetchone() is None:
+            continue
+        if obj["type"] == "table" and table not in analyzed_tables:
+            return True
+        if obj["type"] == "index" and (table, obj["name"]) not in analyzed:
+            return True
+    return False
+
+
+def _update_statistics(conn: sqlite3.Connection) -> bool:
+    """Run ANALYZE if any table or index lacks statistics; return True if it ran."""
+    # The data is static, so statistics only need collecting once per table and
+    # index. Deciding from what is on disk rather than from what this process
+    # built keeps a worker that finds everything in place from writing to the
+    # file, which would break other workers' immutable readers and ETags.
+    if not _statistics_missing(conn):
+        return False
+    conn.execute("ANALYZE")
+    return True
+
+
+def _retry_while_locked(action: Callable[[], T]) -> T:
+    """
+    Call `action` until it stops failing on another process's write lock.
+    
+    Another worker may still be building indexes after the busy timeout
+    expires. Carrying on at that point would open immutable readers on a file
+    that is still changing, so setup keeps waiting instead.
+    """
+    while True:
+        try:
+            return action()
+        except sqlite3.OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            logging.warning("Database is locked by another process, still waiting: %s", e)
+
+
+def _in_write_transaction(conn: sqlite3.Connection, step: Callable[[sqlite3.Connection], T]) -> T:
+    """Run `step` inside its own write transaction, rolling back on error."""
+    def run() -> T:
+        # Take the write lock up front so concurrent workers starting at the
+        # same time do not build the same index twice. Steps re-check what
+        # exists, so after waiting they skip work another worker finished.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = step(conn)
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        return result
+
+    return _retry_while_locked(run)
+
+
+def init_db() -> None:
+    """
+    Create missing lookup indexes, the full-text search table and planner stats.
+    
+    `verses_tri` is an FTS5 trigram index over `verses.text`, which answers
+    the same case-insensitive substring matches as `LIKE '%...%'` without
+    scanning every verse. Building it reads the whole table once, so it only
+    happens the first time the API starts against a database, and requires
+    SQLite 3.34+ with FTS5.
+    
+    Each step commits separately, so a trigram build that fails still keeps
+    the lookup indexes. Every step decides what to do from the file itself, so
+    once another worker has finished setup this one never writes to it. This
+    must run before any pooled connection is opened, since those assume the
+    file never changes, so while another worker holds the write lock this
+    keeps waiting rather than giving up. If the file is read-only the setup is
+    skipped and verse search falls back to a `LIKE` scan, unless the file
+    already ships with the trigram table.
+    """
+    global _verse_fts_enabled
+
+    conn = get_db_connection()
+    try:
+        try:
+            _in_write_transaction(conn, _create_lookup_indexes)
+            if sqlite3.sqlite_version_info >= (3, 34, 0):
+                try:
+                    _in_write_transaction(conn, _create_trigram_table)
+                except sqlite3.OperationalError as e:
+                    # e.g. SQLite built without FTS5
+                    logging.warning("Could not build the verses_tri trigram index: %s", e)
+            _in_write_transaction(conn, _update_statistics)
+            # Immutable readers ignore any WAL file, so fold it back into the
+            # main database in case the file was left in WAL mode.
+            _retry_while_locked(lambda: conn.execute("PRAGMA journal_mode=DELETE"))
+        except sqlite3.Error as e:
+            logging.warning("Skipping database index setup: %s", e)
+
+        _verse_fts_enabled = _table_exists(conn, "verses_tri")
+    finally:
+        conn.close()
+
+
+def verse_fts_enabled() -> bool:
+    """Whether the `verses_tri` trigram index is available for searches."""
+    return _verse_fts_enabled
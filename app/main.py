@@ -1,14 +1,34 @@
 """Main FastAPI application for Bible translations API."""
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+import hashlib
+import os
 import sqlite3
 import logging
 
+from . import cache
+from .database import DATABASE_PATH, close_pool, get_db_connection, init_db
 from .routers import translations, books, verses
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Set up the database before serving and close pooled connections after."""
+    setup_database()
+    try:
+        yield
+    finally:
+        close_pool()
+
+
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title="Bible Translations API",
     description="""
     A RESTful API for accessing Bible translations, books, and verses.
@@ -44,6 +64,64 @@ app = FastAPI(
     }
 )
 
+# Routes whose responses depend only on the (static) database contents.
+_CACHEABLE_PREFIXES = ("/translations", "/books", "/verses")
+_CACHE_CONTROL = "public, max-age=86400, immutable"
+
+# Validator for every cacheable response, derived from the database file's
+# modification time once startup maintenance has finished.
+_etag: Optional[str] = None
+
+
+class StaticDataCacheMiddleware:
+    """
+    Mark reference-data GET responses as cacheable and answer revalidations.
+    
+    Successful responses get an `ETag` and a long-lived `Cache-Control`
+    header. Requests whose `If-None-Match` matches the current ETag receive a
+    `304 Not Modified` without the route running at all. `If-None-Match: *`
+    is passed through to the route, since only the route knows whether the
+    resource exists.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        etag = _etag
+        if (
+            etag is None
+            or scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(_CACHEABLE_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if if_none_match is not None:
+            candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            if etag in candidates:
+                response = Response(
+                    status_code=304,
+                    headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL},
+                )
+                await response(scope, receive, send)
+                return
+
+        async def send_with_cache_headers(message: Message):
+            if message["type"] == "http.response.start" and 200 <= message["status"] < 300:
+                headers = MutableHeaders(scope=message)
+                headers["ETag"] = etag
+                headers["Cache-Control"] = _CACHE_CONTROL
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_headers)
+
+
+# Added before CORS so CORS headers are also applied to 304 responses
+app.add_middleware(StaticDataCacheMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -59,6 +137,26 @@ app.include_router(books.router)
 app.include_router(verses.router)
 
 
+def setup_database():
+    """Create any missing indexes, load the static lookup tables and compute the ETag."""
+    global _etag
+
+    init_db()
+
+    conn = get_db_connection()
+    try:
+        cache.load(conn)
+    finally:
+        conn.close()
+
+    # Include the API version so a deploy that changes response shapes also
+    # invalidates client caches.
+    fingerprint = f"{os.stat(DATABASE_PATH).st_mtime_ns}:{app.version}"
+    _etag = '"' + hashlib.blake2b(fingerprint.encode()).hexdigest()[:16] + '"'
+
+    verses.log_query_plans()
+
+
 # Exception handlers to ensure JSON responses for errors
 @app.exception_handler(sqlite3.OperationalError)
 async def sqlite_exception_handler(request: Request, exc: sqlite3.OperationalError):
@@ -83,7 +181,7 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 
 @app.get("/", tags=["root"])
-def read_root():
+async def read_root():
     """
     Root endpoint providing API information.
     
@@ -103,7 +201,7 @@ def read_root():
 
 
 @app.get("/health", tags=["health"])
-def health_check():
+async def health_check():
     """
     Health check endpoint.
     
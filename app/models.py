@@ -1,5 +1,10 @@
-"""Pydantic models for API request/response schemas."""
-from pydantic import BaseModel, Field
+"""Pydantic models for API request/response schemas.
+
+Endpoints return plain dicts built from trusted database rows, so these models
+mainly describe responses in the OpenAPI docs. `defer_build` postpones building
+their validators until something actually uses them.
+"""
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Literal
 
 
@@ -10,8 +15,7 @@ class Translation(BaseModel):
     abbreviation: str
     language: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class Book(BaseModel):
@@ -20,8 +24,7 @@ class Book(BaseModel):
     name: str
     testament: Literal["OT", "NT"] = Field(..., description="Old Testament (OT) or New Testament (NT)")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class Verse(BaseModel):
@@ -33,8 +36,7 @@ class Verse(BaseModel):
     verse: int
     text: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class VerseWithDetails(BaseModel):
@@ -48,8 +50,7 @@ class VerseWithDetails(BaseModel):
     verse: int
     text: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class VerseRange(BaseModel):
@@ -61,5 +62,4 @@ class VerseRange(BaseModel):
     end_verse: int
     verses: list[Verse]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -2,7 +2,7 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional
 
-from ..database import get_db
+from .. import cache
 from ..models import Book
 
 
@@ -11,9 +11,11 @@ router = APIRouter(
     tags=["books"]
 )
 
+_TESTAMENTS = frozenset({"OT", "NT"})
 
-@router.get("/", response_model=List[Book])
-def get_all_books(testament: Optional[str] = Query(None, description="Filter by testament: OT or NT")):
+
+@router.get("/", response_model=None, responses={200: {"model": List[Book]}})
+async def get_all_books(testament: Optional[str] = Query(None, description="Filter by testament: OT or NT")):
     """
     Get all books of the Bible.
     
@@ -23,23 +25,17 @@ def get_all_books(testament: Optional[str] = Query(None, description="Filter by
     Returns:
         List[Book]: List of books.
     """
-    with get_db() as conn:
-        if testament:
-            if testament.upper() not in ["OT", "NT"]:
-                raise HTTPException(status_code=400, detail="Testament must be OT or NT")
-            cursor = conn.execute(
-                "SELECT id, name, testament FROM books WHERE testament = ? ORDER BY id",
-                (testament.upper(),)
-            )
-        else:
-            cursor = conn.execute("SELECT id, name, testament FROM books ORDER BY id")
-        
-        books = [Book(**dict(row)) for row in cursor.fetchall()]
-    return books
+    if testament:
+        testament_up = testament.upper()
+        if testament_up not in _TESTAMENTS:
+            raise HTTPException(status_code=400, detail="Testament must be OT or NT")
+        return cache.BOOKS_BY_TESTAMENT.get(testament_up, [])
 
+    return cache.BOOKS
 
-@router.get("/{book_id}", response_model=Book)
-def get_book_by_id(book_id: int):
+
+@router.get("/{book_id}", response_model=None, responses={200: {"model": Book}})
+async def get_book_by_id(book_id: int):
     """
     Get a specific book by ID.
     
@@ -52,21 +48,14 @@ def get_book_by_id(book_id: int):
     Raises:
         HTTPException: If book not found.
     """
-    with get_db() as conn:
-        cursor = conn.execute(
-            "SELECT id, name, testament FROM books WHERE id = ?",
-            (book_id,)
-        )
-        row = cursor.fetchone()
-        
-        if not row:
-            raise HTTPException(status_code=404, detail="Book not found")
-        
-        return Book(**dict(row))
+    try:
+        return cache.BOOKS_BY_ID[book_id]
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Book not found")
 
 
-@router.get("/name/{book_name}", response_model=Book)
-def get_book_by_name(book_name: str):
+@router.get("/name/{book_name}", response_model=None, responses={200: {"model": Book}})
+async def get_book_by_name(book_name: str):
     """
     Get a specific book by name.
     
@@ -79,14 +68,7 @@ def get_book_by_name(book_name: str):
     Raises:
         HTTPException: If book not found.
     """
-    with get_db() as conn:
-        cursor = conn.execute(
-            "SELECT id, name, testament FROM books WHERE name = ?",
-            (book_name,)
-        )
-        row = cursor.fetchone()
-        
-        if not row:
-            raise HTTPException(status_code=404, detail="Book not found")
-        
-        return Book(**dict(row))
+    try:
+        return cache.BOOKS_BY_NAME[book_name]
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Book not found")
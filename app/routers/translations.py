@@ -2,7 +2,7 @@
 from fastapi import APIRouter, HTTPException
 from typing import List
 
-from ..database import get_db
+from .. import cache
 from ..models import Translation
 
 
@@ -12,22 +12,19 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=List[Translation])
-def get_all_translations():
+@router.get("/", response_model=None, responses={200: {"model": List[Translation]}})
+async def get_all_translations():
     """
     Get all available Bible translations.
     
     Returns:
         List[Translation]: List of all translations in the database.
     """
-    with get_db() as conn:
-        cursor = conn.execute("SELECT id, name, abbreviation, language FROM translations ORDER BY name")
-        translations = [Translation(**dict(row)) for row in cursor.fetchall()]
-    return translations
+    return cache.TRANSLATIONS
 
 
-@router.get("/{translation_id}", response_model=Translation)
-def get_translation_by_id(translation_id: int):
+@router.get("/{translation_id}", response_model=None, responses={200: {"model": Translation}})
+async def get_translation_by_id(translation_id: int):
     """
     Get a specific translation by ID.
     
@@ -40,21 +37,14 @@ def get_translation_by_id(translation_id: int):
     Raises:
         HTTPException: If translation not found.
     """
-    with get_db() as conn:
-        cursor = conn.execute(
-            "SELECT id, name, abbreviation, language FROM translations WHERE id = ?",
-            (translation_id,)
-        )
-        row = cursor.fetchone()
-        
-        if not row:
-            raise HTTPException(status_code=404, detail="Translation not found")
-        
-        return Translation(**dict(row))
+    try:
+        return cache.TRANSLATIONS_BY_ID[translation_id]
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Translation not found")
 
 
-@router.get("/abbreviation/{abbreviation}", response_model=Translation)
-def get_translation_by_abbreviation(abbreviation: str):
+@router.get("/abbreviation/{abbreviation}", response_model=None, responses={200: {"model": Translation}})
+async def get_translation_by_abbreviation(abbreviation: str):
     """
     Get a specific translation by abbreviation (e.g., KJV, NIV).
     
@@ -67,21 +57,14 @@ def get_translation_by_abbreviation(abbreviation: str):
     Raises:
         HTTPException: If translation not found.
     """
-    with get_db() as conn:
-        cursor = conn.execute(
-            "SELECT id, name, abbreviation, language FROM translations WHERE abbreviation = ?",
-            (abbreviation.upper(),)
-        )
-        row = cursor.fetchone()
-        
-        if not row:
-            raise HTTPException(status_code=404, detail="Translation not found")
-        
-        return Translation(**dict(row))
+    try:
+        return cache.TRANSLATIONS_BY_ABBR[abbreviation.upper()]
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Translation not found")
 
 
-@router.get("/language/{language}", response_model=List[Translation])
-def get_translations_by_language(language: str):
+@router.get("/language/{language}", response_model=None, responses={200: {"model": List[Translation]}})
+async def get_translations_by_language(language: str):
     """
     Get all translations for a specific language.
     
@@ -94,14 +77,7 @@ def get_translations_by_language(language: str):
     Raises:
         HTTPException: If no translations found for the language.
     """
-    with get_db() as conn:
-        cursor = conn.execute(
-            "SELECT id, name, abbreviation, language FROM translations WHERE language = ? ORDER BY name",
-            (language,)
-        )
-        translations = [Translation(**dict(row)) for row in cursor.fetchall()]
-        
-        if not translations:
-            raise HTTPException(status_code=404, detail=f"No translations found for language: {language}")
-        
-        return translations
+    try:
+        return cache.TRANSLATIONS_BY_LANGUAGE[language]
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"No translations found for language: {language}")
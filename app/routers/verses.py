@@ -1,8 +1,20 @@
 """API router for verses endpoints."""
 from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from typing import Iterator, List, Literal, Optional, Sequence
+import logging
+import sqlite3
 
-from ..database import get_db
+import orjson
+
+from .. import cache
+from ..database import (
+    acquire_connection,
+    fetch_all,
+    release_connection,
+    run_query,
+    verse_fts_enabled,
+)
 from ..models import Verse, VerseWithDetails
 
 
@@ -11,9 +23,162 @@ router = APIRouter(
     tags=["verses"]
 )
 
+_TESTAMENTS = frozenset({"OT", "NT"})
+
+_VERSE_COLUMNS = "v.id, v.translation_id, v.book_id, v.chapter, v.verse, v.text"
+_VERSE_FIELDS = ("id", "translation_id", "book_id", "chapter", "verse", "text")
+
+# SQL text is kept constant per query shape: sqlite3 caches compiled statements
+# per connection keyed by the SQL string, so pooled connections skip re-parsing.
+SQL_GET_VERSE_BY_ID = f"SELECT {_VERSE_COLUMNS} FROM verses v WHERE v.id = ?"
+SQL_GET_VERSES = (
+    f"SELECT {_VERSE_COLUMNS} FROM verses v "
+    "WHERE v.translation_id = ? AND v.book_id = ? AND v.chapter = ?"
+)
+# `_fetch_verses` queries keyed by (verse_start given, verse_end given). An end
+# verse without a start verse is ignored, as it always has been.
+_QUERIES = {
+    (False, False): SQL_GET_VERSES + " ORDER BY v.verse",
+    (False, True): SQL_GET_VERSES + " ORDER BY v.verse",
+    (True, False): SQL_GET_VERSES + " AND v.verse = ? ORDER BY v.verse",
+    (True, True): SQL_GET_VERSES + " AND v.verse BETWEEN ? AND ? ORDER BY v.verse",
+}
+
+# Short ranges are sent as an explicit IN list, which SQLite answers with one
+# index seek per verse instead of a BETWEEN range scan. Keyed by verse count.
+_MAX_IN_RANGE = 16
+_RANGE_IN_QUERIES = {
+    count: SQL_GET_VERSES + f" AND v.verse IN ({', '.join('?' * count)}) ORDER BY v.verse"
+    for count in range(1, _MAX_IN_RANGE + 1)
+}
+
+SQL_SEARCH_VERSES_FTS = (
+    f"SELECT {_VERSE_COLUMNS} FROM verses v "
+    "WHERE v.id IN (SELECT rowid FROM verses_tri WHERE verses_tri MATCH ?)"
+)
+SQL_SEARCH_VERSES_LIKE = f"SELECT {_VERSE_COLUMNS} FROM verses v WHERE v.text LIKE ?"
+
+
+def _with_details(row: tuple) -> dict:
+    """Build a `VerseWithDetails` payload from a `_VERSE_COLUMNS` row and the startup cache."""
+    verse_id, translation_id, book_id, chapter, verse, text = row
+    translation = cache.TRANSLATIONS_BY_ID[translation_id]
+    book = cache.BOOKS_BY_ID[book_id]
+    return {
+        "id": verse_id,
+        "translation_name": translation["name"],
+        "translation_abbreviation": translation["abbreviation"],
+        "book_name": book["name"],
+        "testament": book["testament"],
+        "chapter": chapter,
+        "verse": verse,
+        "text": text,
+    }
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+# Rows fetched (and encoded) per streamed chunk. StreamingResponse pulls each
+# chunk through the threadpool, so batching avoids a thread hop per row.
+_STREAM_BATCH_SIZE = 256
+
+
+def _stream_verses(conn: sqlite3.Connection, sql: str, params: Sequence) -> Iterator[bytes]:
+    """
+    Yield matching verses as NDJSON, one chunk per batch of fetched rows.
+    
+    `conn` goes back to the pool once the generator finishes or is closed.
+    The first item is an empty placeholder: advance past it before handing the
+    generator to the response, so the connection is released even if the
+    client disconnects before the body is ever iterated.
+    """
+    try:
+        yield b""
+        cursor = conn.execute(sql, params)
+        cursor.arraysize = _STREAM_BATCH_SIZE
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield b"".join(
+                orjson.dumps(_with_details(row), option=orjson.OPT_APPEND_NEWLINE)
+                for row in rows
+            )
+    finally:
+        release_connection(conn)
+
+
+def _empty_search_result(response_format: str) -> Response:
+    if response_format == "ndjson":
+        return Response(media_type=NDJSON_MEDIA_TYPE)
+    return ORJSONResponse(content=[])
+
+
+# Uvicorn only configures its own loggers and leaves the root logger at
+# WARNING, so INFO lines go through its general-purpose logger to be seen.
+_server_logger = logging.getLogger("uvicorn.error")
+
+
+def log_query_plans() -> None:
+    """Log SQLite's query plan for the verse range lookups once, at startup."""
+    samples = (
+        ("range (IN)", _RANGE_IN_QUERIES[5], (1, 1, 1, 1, 2, 3, 4, 5)),
+        ("range (BETWEEN)", _QUERIES[True, True], (1, 1, 1, 1, 50)),
+    )
+    for label, sql, params in samples:
+        plan = run_query("EXPLAIN QUERY PLAN " + sql, params)
+        _server_logger.info("Verse %s query plan: %s", label, "; ".join(row[3] for row in plan))
+
 
-@router.get("/", response_model=List[VerseWithDetails])
-def get_verses(
+async def _fetch_verses(
+    translation: str,
+    book_id: int,
+    chapter: int,
+    verse_start: Optional[int] = None,
+    verse_end: Optional[int] = None,
+) -> List[dict]:
+    """
+    Fetch one chapter's verses, optionally narrowed to a verse or verse range.
+    
+    Shared by `get_verses` and `get_chapter`, so the chapter endpoint does not
+    declare or validate the verse parameters it never uses.
+    
+    Raises:
+        HTTPException: If the translation, book or verses are not found.
+    """
+    translation_row = cache.TRANSLATIONS_BY_ABBR.get(translation.upper())
+    if translation_row is None or book_id not in cache.BOOKS_BY_ID:
+        raise HTTPException(
+            status_code=404,
+            detail="No verses found for the specified criteria"
+        )
+
+    query = _QUERIES[verse_start is not None, verse_end is not None]
+    translation_id = translation_row["id"]
+    if verse_start is None:
+        params = (translation_id, book_id, chapter)
+    elif verse_end is None:
+        params = (translation_id, book_id, chapter, verse_start)
+    elif 0 <= verse_end - verse_start < _MAX_IN_RANGE:
+        query = _RANGE_IN_QUERIES[verse_end - verse_start + 1]
+        params = (translation_id, book_id, chapter, *range(verse_start, verse_end + 1))
+    else:
+        params = (translation_id, book_id, chapter, verse_start, verse_end)
+    
+    verses = [_with_details(row) for row in await fetch_all(query, params)]
+    
+    if not verses:
+        raise HTTPException(
+            status_code=404,
+            detail="No verses found for the specified criteria"
+        )
+    
+    return verses
+
+
+@router.get("/", response_model=None, responses={200: {"model": List[VerseWithDetails]}})
+async def get_verses(
     translation: str = Query(..., description="Translation abbreviation (e.g., KJV, NIV)"),
     book_id: int = Query(..., description="Book id (integer)"),
     chapter: int = Query(..., description="Chapter number"),
@@ -36,49 +201,14 @@ def get_verses(
     Raises:
         HTTPException: If translation or book not found.
     """
-    with get_db() as conn:
-        # Build query based on parameters
-        query = """
-            SELECT 
-                v.id,
-                t.name as translation_name,
-                t.abbreviation as translation_abbreviation,
-                b.name as book_name,
-                b.testament,
-                v.chapter,
-                v.verse,
-                v.text
-            FROM verses v
-            JOIN translations t ON v.translation_id = t.id
-            JOIN books b ON v.book_id = b.id
-            WHERE t.abbreviation = ? AND b.id = ? AND v.chapter = ?
-        """
-        params = [translation.upper(), book_id, chapter]
-        
-        if verse_start is not None:
-            if verse_end is not None:
-                query += " AND v.verse BETWEEN ? AND ?"
-                params.extend([verse_start, verse_end])
-            else:
-                query += " AND v.verse = ?"
-                params.append(verse_start)
-        
-        query += " ORDER BY v.verse"
-        
-        cursor = conn.execute(query, params)
-        verses = [VerseWithDetails(**dict(row)) for row in cursor.fetchall()]
-        
-        if not verses:
-            raise HTTPException(
-                status_code=404,
-                detail="No verses found for the specified criteria"
-            )
-        
-        return verses
+    verses = await _fetch_verses(translation, book_id, chapter, verse_start, verse_end)
+    
+    # Returning the response directly skips FastAPI's jsonable_encoder pass.
+    return ORJSONResponse(content=verses)
 
 
-@router.get("/{verse_id}", response_model=Verse)
-def get_verse_by_id(verse_id: int):
+@router.get("/{verse_id}", response_model=None, responses={200: {"model": Verse}})
+async def get_verse_by_id(verse_id: int):
     """
     Get a specific verse by ID.
     
@@ -91,77 +221,93 @@ def get_verse_by_id(verse_id: int):
     Raises:
         HTTPException: If verse not found.
     """
-    with get_db() as conn:
-        cursor = conn.execute(
-            "SELECT id, translation_id, book_id, chapter, verse, text FROM verses WHERE id = ?",
-            (verse_id,)
-        )
-        row = cursor.fetchone()
-        
-        if not row:
-            raise HTTPException(status_code=404, detail="Verse not found")
-        
-        return Verse(**dict(row))
+    rows = await fetch_all(SQL_GET_VERSE_BY_ID, (verse_id,))
+    
+    if not rows:
+        raise HTTPException(status_code=404, detail="Verse not found")
+    
+    return ORJSONResponse(content=dict(zip(_VERSE_FIELDS, rows[0])))
 
 
-@router.get("/search/text", response_model=List[VerseWithDetails])
-def search_verses(
+@router.get(
+    "/search/text",
+    response_model=None,
+    responses={200: {"model": List[VerseWithDetails], "content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def search_verses(
     query: str = Query(..., min_length=3, description="Search query (minimum 3 characters)"),
     translation: Optional[str] = Query(None, description="Filter by translation abbreviation"),
     testament: Optional[str] = Query(None, description="Filter by testament: OT or NT"),
-    limit: int = Query(100, le=1000, description="Maximum number of results (max 1000)")
+    limit: int = Query(100, le=1000, description="Maximum number of results (max 1000)"),
+    response_format: Literal["json", "ndjson"] = Query(
+        "json",
+        alias="format",
+        description="`json` for a single array, `ndjson` to stream one verse per line",
+    ),
 ):
     """
     Search for verses containing specific text.
     
+    Matching is a case-insensitive substring search, served from the
+    `verses_tri` trigram index when available and a full scan otherwise.
+    
     Args:
         query: Search query (minimum 3 characters).
         translation: Optional filter by translation abbreviation.
         testament: Optional filter by testament (OT or NT).
         limit: Maximum number of results (max 1000).
+        response_format: `json` (default) or `ndjson`. NDJSON is streamed
+            while rows are fetched instead of being built up in memory.
         
     Returns:
         List[VerseWithDetails]: List of matching verses with full details.
     """
-    with get_db() as conn:
-        sql_query = """
-            SELECT 
-                v.id,
-                t.name as translation_name,
-                t.abbreviation as translation_abbreviation,
-                b.name as book_name,
-                b.testament,
-                v.chapter,
-                v.verse,
-                v.text
-            FROM verses v
-            JOIN translations t ON v.translation_id = t.id
-            JOIN books b ON v.book_id = b.id
-            WHERE v.text LIKE ?
-        """
+    testament_up = testament.upper() if testament else None
+    if testament_up is not None and testament_up not in _TESTAMENTS:
+        raise HTTPException(status_code=400, detail="Testament must be OT or NT")
+
+    if verse_fts_enabled():
+        # Quote the query as one FTS5 phrase so it is matched as a literal
+        # substring rather than parsed as query syntax; quotes are doubled.
+        sql_query = SQL_SEARCH_VERSES_FTS
+        params = ['"' + query.replace('"', '""') + '"']
+    else:
+        sql_query = SQL_SEARCH_VERSES_LIKE
         params = [f"%{query}%"]
-        
-        if translation:
-            sql_query += " AND t.abbreviation = ?"
-            params.append(translation.upper())
-        
-        if testament:
-            if testament.upper() not in ["OT", "NT"]:
-                raise HTTPException(status_code=400, detail="Testament must be OT or NT")
-            sql_query += " AND b.testament = ?"
-            params.append(testament.upper())
-        
-        sql_query += " LIMIT ?"
-        params.append(limit)
-        
-        cursor = conn.execute(sql_query, params)
-        verses = [VerseWithDetails(**dict(row)) for row in cursor.fetchall()]
-        
-        return verses
+    
+    # Filters are resolved against the cached lookup tables, so an unknown
+    # translation or empty testament can short-circuit without a query.
+    if translation:
+        translation_row = cache.TRANSLATIONS_BY_ABBR.get(translation.upper())
+        if translation_row is None:
+            return _empty_search_result(response_format)
+        sql_query += " AND v.translation_id = ?"
+        params.append(translation_row["id"])
+    
+    if testament_up is not None:
+        book_ids = cache.BOOK_IDS_BY_TESTAMENT.get(testament_up)
+        if not book_ids:
+            return _empty_search_result(response_format)
+        sql_query += f" AND v.book_id IN ({', '.join('?' * len(book_ids))})"
+        params.extend(book_ids)
+    
+    sql_query += " LIMIT ?"
+    params.append(limit)
+    
+    if response_format == "ndjson":
+        # Take the connection here rather than inside the stream: the stream
+        # runs on anyio's default threads, which must never wait on the pool.
+        stream = _stream_verses(await acquire_connection(), sql_query, params)
+        next(stream)
+        return StreamingResponse(stream, media_type=NDJSON_MEDIA_TYPE)
+    
+    verses = [_with_details(row) for row in await fetch_all(sql_query, params)]
+    
+    return ORJSONResponse(content=verses)
 
 
-@router.get("/chapter/all", response_model=List[VerseWithDetails])
-def get_chapter(
+@router.get("/chapter/all", response_model=None, responses={200: {"model": List[VerseWithDetails]}})
+async def get_chapter(
     translation: str = Query(..., description="Translation abbreviation (e.g., KJV, NIV)"),
     book_id: int = Query(..., description="Book id (integer)"),
     chapter: int = Query(..., description="Chapter number")
@@ -180,32 +326,6 @@ def get_chapter(
     Raises:
         HTTPException: If no verses found.
     """
-    with get_db() as conn:
-        query = """
-            SELECT 
-                v.id,
-                t.name as translation_name,
-                t.abbreviation as translation_abbreviation,
-                b.name as book_name,
-                b.testament,
-                v.chapter,
-                v.verse,
-                v.text
-            FROM verses v
-            JOIN translations t ON v.translation_id = t.id
-            JOIN books b ON v.book_id = b.id
-            WHERE t.abbreviation = ? AND b.id = ? AND v.chapter = ?
-            ORDER BY v.verse
-        """
-        params = [translation.upper(), book_id, chapter]
-        
-        cursor = conn.execute(query, params)
-        verses = [VerseWithDetails(**dict(row)) for row in cursor.fetchall()]
-        
-        if not verses:
-            raise HTTPException(
-                status_code=404,
-                detail="No verses found for the specified criteria"
-            )
-        
-        return verses
+    verses = await _fetch_verses(translation, book_id, chapter)
+    
+    return ORJSONResponse(content=verses)
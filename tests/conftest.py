@@ -0,0 +1,69 @@
+import atexit
+import os
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+from urllib.parse import quote
+
+import pytest
+
+# The app reads its settings at import time, so point it at a small throwaway
+# database with a single pooled connection before any test imports it.
+_DB_DIR = tempfile.mkdtemp(prefix="bibles-tests-")
+atexit.register(shutil.rmtree, _DB_DIR, ignore_errors=True)
+DB_PATH = os.path.join(_DB_DIR, "bibles.db")
+os.environ["BIBLES_DB_PATH"] = DB_PATH
+os.environ["BIBLES_DB_POOL_SIZE"] = "1"
+
+
+def _build_database(path: str) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE translations (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            abbreviation TEXT NOT NULL UNIQUE,
+            language TEXT NOT NULL
+        );
+        CREATE TABLE books (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            testament TEXT NOT NULL
+        );
+        CREATE TABLE verses (
+            id INTEGER PRIMARY KEY,
+            translation_id INTEGER NOT NULL REFERENCES translations(id),
+            book_id INTEGER NOT NULL REFERENCES books(id),
+            chapter INTEGER NOT NULL,
+            verse INTEGER NOT NULL,
+            text TEXT NOT NULL
+        );
+        INSERT INTO translations VALUES (1, 'King James Version', 'KJV', 'English');
+        INSERT INTO books VALUES (1, 'Genesis', 'OT'), (43, 'John', 'NT');
+    """)
+    conn.executemany(
+        "INSERT INTO verses (translation_id, book_id, chapter, verse, text) VALUES (1, ?, ?, ?, ?)",
+        [
+            (book_id, chapter, verse, f"For God so loved the world, {book_id}:{chapter}:{verse}")
+            for book_id in (1, 43)
+            for chapter in (1, 2, 3)
+            for verse in range(1, 31)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+_build_database(DB_PATH)
+
+
+@pytest.fixture
+def fresh_database(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A newly built database, without setup, that `get_db_connection()` opens."""
+    from app import database
+
+    path = tmp_path / "bibles.db"
+    _build_database(str(path))
+    monkeypatch.setattr(database, "_READ_WRITE_URI", f"file:{quote(path.as_posix())}?mode=rw")
+    return path
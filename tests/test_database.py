@@ -0,0 +1,49 @@
+import hashlib
+from pathlib import Path
+
+from app import database
+from app.database import (
+    _create_lookup_indexes,
+    _create_trigram_table,
+    _in_write_transaction,
+    _update_statistics,
+    get_db_connection,
+)
+
+
+def _snapshot(path: Path) -> tuple:
+    return path.stat().st_mtime_ns, hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_setup_split_across_workers_stops_writing_once_first_worker_finishes(fresh_database):
+    worker_a = get_db_connection()
+    worker_b = get_db_connection()
+    try:
+        # A builds the lookup indexes and B, finding them in place, builds the
+        # trigram table: both have changed the schema this start-up.
+        assert _in_write_transaction(worker_a, _create_lookup_indexes)
+        assert not _in_write_transaction(worker_b, _create_lookup_indexes)
+        assert _in_write_transaction(worker_b, _create_trigram_table)
+        assert not _in_write_transaction(worker_a, _create_trigram_table)
+
+        # A finishes setup; from here on it serves immutable readers.
+        assert _in_write_transaction(worker_a, _update_statistics)
+        worker_a.execute("PRAGMA journal_mode=DELETE")
+        finished = _snapshot(fresh_database)
+
+        assert not _in_write_transaction(worker_b, _update_statistics)
+        worker_b.execute("PRAGMA journal_mode=DELETE")
+        assert _snapshot(fresh_database) == finished
+    finally:
+        worker_a.close()
+        worker_b.close()
+
+
+def test_init_db_leaves_a_set_up_database_untouched(fresh_database):
+    database.init_db()
+    finished = _snapshot(fresh_database)
+
+    database.init_db()
+
+    assert _snapshot(fresh_database) == finished
+    assert database.verse_fts_enabled()
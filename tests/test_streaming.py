@@ -0,0 +1,43 @@
+import asyncio
+
+import anyio.to_thread
+import httpx
+import orjson
+
+from app import database
+from app.main import app, setup_database
+
+# anyio's default thread limiter, which StreamingResponse uses to pull chunks
+# from a sync iterator, is shrunk so the test overloads it with few requests.
+_DEFAULT_THREADS = 2
+_STREAMS = database.POOL_SIZE + _DEFAULT_THREADS + 2
+_LIMIT = 10
+
+
+async def _search_ndjson(client: httpx.AsyncClient) -> httpx.Response:
+    return await client.get(
+        "/verses/search/text", params={"query": "loved", "limit": _LIMIT, "format": "ndjson"}
+    )
+
+
+async def _run_concurrent_streams() -> list:
+    anyio.to_thread.current_default_thread_limiter().total_tokens = _DEFAULT_THREADS
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.wait_for(
+            asyncio.gather(*(_search_ndjson(client) for _ in range(_STREAMS))), timeout=10
+        )
+
+
+def test_concurrent_ndjson_streams_do_not_deadlock():
+    setup_database()
+
+    responses = asyncio.run(_run_concurrent_streams())
+
+    assert len(responses) == _STREAMS
+    for response in responses:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = response.content.splitlines()
+        assert len(lines) == _LIMIT
+        assert all(b"loved" in orjson.loads(line)["text"].encode() for line in lines)